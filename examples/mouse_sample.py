@@ -3,17 +3,25 @@
 #
 # SPDX-License-Identifier: Unlicense
 
+import sys
+import time
 import board
+import supervisor
 import PMW3360
+from micropython import const
 from digitalio import DigitalInOut, Direction
 import usb_hid
 from adafruit_hid.mouse import Mouse
 
 mouse = Mouse(usb_hid.devices)
 
+# Print every movement to the serial console. Printing blocks until the
+# text is sent, which drastically lowers the mouse report rate.
+DEBUG = False
+
 # board.CLK may be board.SCK depending on the board
 # board.D10 is the cs pin
-sensor = PMW3360.PMW3360(board.CLK, board.MOSI, board.MISO, board.D10)
+sensor = PMW3360.PMW3360(board.CLK, board.MOSI, board.MISO, board.D10, baudrate=2000000)
 
 # Any pin. Goes LOW if motion is detected. More reliable.
 mt_pin = DigitalInOut(board.A0)
@@ -27,33 +35,52 @@ sensor.set_CPI(1200)
 print(sensor.get_CPI())
 
 
-def constrain(val, min_val, max_val):
-    return min(max_val, max(min_val, val))
-
+# Movement is accumulated and sent once per USB HID polling interval (1 ms)
+# rather than on every read, so reports don't queue up on the USB bus.
+# supervisor.ticks_ms() stays a small int (no allocation, no long-int
+# support needed) and wraps around at 2**29, hence the mask.
+_HID_INTERVAL_MS = const(1)
+_TICKS_MASK = const((1 << 29) - 1)
+# Seconds to idle while there is no motion
+IDLE_SLEEP = 0.001
 
-# Convert 16-bit unsigned value into a signed value
-def delta(value):
-    # Negative if MSB is 1
-    if value & 0x8000:
-        return -(~value & 0x7FFF)
+# Look up frequently used methods once, outside the loop
+read_burst_motion = sensor.read_burst_motion
+move = mouse.move
+ticks_ms = supervisor.ticks_ms
+sleep = time.sleep
+write = sys.stdout.write
 
-    return value & 0x7FFF
+# Nothing else shares the SPI bus, so keep it locked for the sensor
+sensor.begin_fast_poll()
 
+acc_x = acc_y = 0
+last_send = ticks_ms()
 
 while True:
-    data = sensor.read_burst()
-    dx = delta(data["dx"])
-    dy = delta(data["dy"])
-
-    # Limit values if needed
-    # dx = constrain(delta(data["dx"]), -127, 127
-    # dy = constrain(delta(data["dy"]), -127, 127)
-
-    # uncomment if mt_pin isn't used
-    # if data["isOnSurface"] == True and data["isMotion"] and mt_pin.value == True:
+    # The motion pin goes LOW when there is motion to report, so skip the
+    # SPI transfer while it is HIGH. If mt_pin isn't used, read every time
+    # and only accumulate when the third value (is_motion) is True.
     if mt_pin.value == 0:
-        print(dx)
-        print(dy)
-        print("")
-
-        mouse.move(dx, dy)
+        dx, dy, _ = read_burst_motion()
+        acc_x += dx
+        acc_y += dy
+    elif not (acc_x or acc_y):
+        # Nothing to read or send. Sleeping lets the CPU idle and the USB
+        # stack run instead of spinning until the next motion.
+        sleep(IDLE_SLEEP)
+        continue
+
+    now = ticks_ms()
+    if (acc_x or acc_y) and (now - last_send) & _TICKS_MASK >= _HID_INTERVAL_MS:
+        # Limit values to a single HID report if needed
+        # acc_x = max(-127, min(127, acc_x))
+        # acc_y = max(-127, min(127, acc_y))
+
+        if DEBUG:
+            write(f"{acc_x} {acc_y}\n")
+
+        # Mouse.move splits values outside -127..127 into several reports
+        move(acc_x, acc_y)
+        acc_x = acc_y = 0
+        last_send = now
@@ -3,13 +3,14 @@
 #
 # SPDX-License-Identifier: Unlicense
 
+import time
 import board
 import PMW3360
 from digitalio import DigitalInOut, Direction
 
 # board.SCK may be board.CLK depending on the board
 # board.D10 is the cs pin
-sensor = PMW3360.PMW3360(board.SCK, board.MOSI, board.MISO, board.D10)
+sensor = PMW3360.PMW3360(board.SCK, board.MOSI, board.MISO, board.D10, baudrate=2000000)
 
 # Any pin. Goes LOW if motion is detected. More reliable.
 mt_pin = DigitalInOut(board.A0)
@@ -25,11 +26,18 @@ else:
 sensor.set_CPI(1200)
 print(sensor.get_CPI())
 
+# Look up frequently used methods once, outside the loop
+read_burst = sensor.read_burst
+
 while True:
-    # Captures a snapshot
-    data = sensor.read_burst()
+    # The motion pin goes LOW when there is motion to report, so skip the
+    # SPI transfer while it is HIGH. If mt_pin isn't used, remove this check
+    # and only print when data.is_on_surface and data.is_motion are set.
+    if mt_pin.value:
+        # Let the CPU idle instead of spinning
+        time.sleep(0.001)
+        continue
 
-    # uncomment if mt_pin isn't used
-    # if data["is_on_surface"] == True and data["is_motion"] == True:
-    if mt_pin.value == 0:
-        print(data)
+    # Captures a snapshot
+    data = read_burst()
+    print(data)
@@ -29,6 +29,8 @@ Implementation Notes
 
 # imports
 import time
+import struct
+from collections import namedtuple
 import board
 import busio
 import micropython
@@ -88,8 +90,18 @@ _REG_Lift_Config = const(0x63)
 _REG_Raw_Data_Burst = const(0x64)
 _REG_LiftCutoff_Tune2 = const(0x65)
 
-# firmware data broken up to not exhaust the pystack
-_FIRMWARE_DATA_1 = bytearray(
+# attempts at writing Config1 before set_CPI gives up
+_CPI_RETRIES = const(5)
+
+# address byte sent before each motion burst read
+_BURST_CMD = bytes((_REG_Motion_Burst,))
+# Motion_Burst layout: Motion, Observation, Delta_X (signed), Delta_Y (signed),
+# SQUAL, Raw_Data_Sum, Maximum_Raw_Data, Minimum_Raw_Data, Shutter. LSB first.
+_BURST_FORMAT = "<BBhhBBBBH"
+
+# firmware data broken up to not exhaust the pystack. Kept as immutable bytes
+# so a frozen build can leave the literals in flash.
+_FIRMWARE_DATA_1 = (
     b"\x01\x04\x8e\x96\x6e\x77\x3e\xfe\x7e\x5f\x1d\xb8\xf2\x66\x4e"
     b"\xff\x5d\x19\xb0\xc2\x04\x69\x54\x2a\xd6\x2e\xbf\xdd\x19\xb0"
     b"\xc3\xe5\x29\xb1\xe0\x23\xa5\xa9\xb1\xc1\x00\x82\x67\x4c\x1a"
@@ -115,7 +127,7 @@ _FIRMWARE_DATA_1 = bytearray(
     b"\x67\x14\x09\x9c\x7f\x0c\x18\xba\x3b\xd6\x8e\x14\x2a\xe4\x1b"
 )
 
-_FIRMWARE_DATA_2 = bytearray(
+_FIRMWARE_DATA_2 = (
     b"\x52\x9f\x2b\x7d\xe1\xfb\x6a\x33\x02\xfa\xac\x5a\xf2\x3e\x88"
     b"\x7e\xae\xd1\xf3\x78\xe8\x05\xd1\xe3\xdc\x21\xf6\xe1\x9a\xbd"
     b"\x17\x0e\xd9\x46\x9b\x88\x03\xea\xf6\x66\xbe\x0e\x1b\x50\x49"
@@ -141,7 +153,7 @@ _FIRMWARE_DATA_2 = bytearray(
     b"\xd1\x32\x2e\x8a\x9f\x2c\x58\x06\x48\x27\xc5\xa9\x5e\x81\x47"
 )
 
-_FIRMWARE_DATA_3 = bytearray(
+_FIRMWARE_DATA_3 = (
     b"\x89\x46\x21\x91\x03\x70\xa4\x3e\x88\x9c\xda\x33\x0a\xce\xbc"
     b"\x8b\x8e\xcf\x9f\xd3\x71\x80\x43\xcf\x6b\xa9\x51\x83\x76\x30"
     b"\x82\xc5\x6a\x85\x39\x11\x50\x1a\x82\xdc\x1e\x1c\xd5\x7d\xa9"
@@ -167,7 +179,7 @@ _FIRMWARE_DATA_3 = bytearray(
     b"\x0a\x30\x73\xa8\xff\x8a\x97\xe9\xa7\x6a\x8e\x0d\xe8\xf0\xdf"
 )
 
-_FIRMWARE_DATA_4 = bytearray(
+_FIRMWARE_DATA_4 = (
     b"\xec\xea\xb4\x6c\x1d\x39\x2a\x62\x2d\x3d\x5a\x8b\x65\xf8\x90"
     b"\x05\x2e\x7e\x91\x2c\x78\xef\x8e\x7a\xc1\x2f\xac\x78\xee\xaf"
     b"\x28\x45\x06\x4c\x26\xaf\x3b\xa2\xdb\xa3\x93\x06\xb5\x3c\xa5"
@@ -193,7 +205,7 @@ _FIRMWARE_DATA_4 = bytearray(
     b"\x9f\x1e\x95\x16\xda\x56\x1d\x4f\x9a\x53\xb2\xe2\xe4\x18\xcb"
 )
 
-_FIRMWARE_DATA_5 = bytearray(
+_FIRMWARE_DATA_5 = (
     b"\x6b\x1a\x65\xeb\x56\xc6\x3b\xe5\xfe\xd8\x26\x3f\x3a\x84\x59"
     b"\x72\x66\xa2\xf3\x75\xff\xfb\x60\xb3\x22\xad\x3f\x2d\x6b\xf9"
     b"\xeb\xea\x05\x7c\xd8\x8f\x6d\x2c\x98\x9e\x2b\x93\xf1\x5e\x46"
@@ -219,7 +231,7 @@ _FIRMWARE_DATA_5 = bytearray(
     b"\xb4\xbf\xa5\x4d\x9b\x9f\x02\x93\xc4\xe3\xe4\xe8\x42\x2d\x68"
 )
 
-_FIRMWARE_DATA_6 = bytearray(
+_FIRMWARE_DATA_6 = (
     b"\x81\x15\x0a\xeb\x84\x5b\xd6\xa8\x74\xfb\x7d\x1d\xcb\x2c\xda"
     b"\x46\x2a\x76\x62\xce\xbc\x5c\x9e\x8b\xe7\xcf\xbe\x78\xf5\x7c"
     b"\xeb\xb3\x3a\x9c\xaa\x6f\xcc\x72\xd1\x59\xf2\x11\x23\xd6\x3f"
@@ -245,7 +257,7 @@ _FIRMWARE_DATA_6 = bytearray(
     b"\x73\x00\x6a\x71\xed\x4e\x9d\x25\x1a\xc3\x3c\x4a\x95\x15\x99"
 )
 
-_FIRMWARE_DATA_7 = bytearray(
+_FIRMWARE_DATA_7 = (
     b"\x35\x81\x14\x02\xd6\x98\x9b\xec\xd8\x23\x3b\x84\x29\xaf\x0c"
     b"\x99\x83\xa6\x9a\x34\x4f\xfa\xe8\xd0\x3c\x4b\xd0\xfb\xb6\x68"
     b"\xb8\x9e\x8f\xcd\xf7\x60\x2d\x7a\x22\xe5\x7d\xab\x65\x1b\x95"
@@ -271,7 +283,7 @@ _FIRMWARE_DATA_7 = bytearray(
     b"\x3f\xaa\xec\xed\x5c\x6f\x0e\xad\x43\x87\xfd\x93\x35\xe6\x01"
 )
 
-_FIRMWARE_DATA_8 = bytearray(
+_FIRMWARE_DATA_8 = (
     b"\xef\x41\x26\x90\x99\x9e\xfb\x19\x5b\xad\xd2\x91\x8a\xe0\x46"
     b"\xaf\x65\xfa\x4f\x84\xc1\xa1\x2d\xcf\x45\x8b\xd3\x85\x50\x55"
     b"\x7c\xf9\x67\x88\xd4\x4e\xe9\xd7\x6b\x61\x54\xa1\xa4\xa6\xa2"
@@ -297,7 +309,7 @@ _FIRMWARE_DATA_8 = bytearray(
     b"\x59\xdc\x06\xbc\xb6\x85\x0d\x06\x22\xec\xb1\xcb\xe5\x04\xe6"
 )
 
-_FIRMWARE_DATA_9 = bytearray(
+_FIRMWARE_DATA_9 = (
     b"\x3d\xb3\xb0\x41\x73\x08\x3f\x3c\x58\x86\x63\xeb\x50\xee\x1d"
     b"\x2c\x37\x74\xa9\xd3\x18\xa3\x47\x6e\x93\x54\xad\x0a\x5d\xb8"
     b"\x2a\x55\x5d\x78\xf6\xee\xbe\x8e\x3c\x76\x69\xb9\x40\xc2\x34"
@@ -323,7 +335,7 @@ _FIRMWARE_DATA_9 = bytearray(
     b"\x8c\x62\xb5\x20\x9d\x0c\x53\x8a\x68\x1b\xd2\x8f\x75\x17\x5d"
 )
 
-_FIRMWARE_DATA_10 = bytearray(
+_FIRMWARE_DATA_10 = (
     b"\xd4\xe5\xda\x75\x62\x19\x14\x6a\x26\x2d\xeb\xf8\xaf\x37\xf0"
     b"\x6c\xa4\x55\xb1\xbc\xe2\x33\xc0\x9a\xca\xb0\x11\x49\x4f\x68"
     b"\x9b\x3b\x6b\x3c\xcc\x13\xf6\xc7\x85\x61\x68\x42\xae\xbb\xdd"
@@ -347,7 +359,7 @@ _FIRMWARE_DATA_10 = bytearray(
     b"\x3c\xfa\x76\x4f\xfd\x59\x30\xe2\x46\xef\x3d\xf8\x53\x05\x69"
 )
 
-_FIRMWARE_DATA_11 = bytearray(
+_FIRMWARE_DATA_11 = (
     b"\x31\xc1\x00\x82\x86\x8e\x7f\x5d\x19\xb0\xe2\x27\xcc\xfb\x74"
     b"\x4b\x14\x8b\x94\x8b\x75\x68\x33\xc5\x08\x92\x87\x8c\x9a\xb6"
     b"\xcf\x1c\xba\xd7\x0d\x98\xb2\xe6\x2f\xdc\x1b\x95\x89\x71\x60"
@@ -372,7 +384,7 @@ _FIRMWARE_DATA_11 = bytearray(
     b"\x93\x85\x88\x73\x64\x4a\xf7\x4d\xf9\x51\x20\xa3\xc4\x0a\x96"
 )
 
-_FIRMWARE_DATA_12 = bytearray(
+_FIRMWARE_DATA_12 = (
     b"\xae\xde\x3e\xfe\x7e\x7e\x7e\x5f\x3c\xfa\x76\x4f\xfd\x78\x72"
     b"\x66\x2f\xbd\xd9\x30\xc3\xe5\x48\x12\x87\x8c\x7b\x55\x28\xd2"
     b"\x07\x8c\x9a\x97\xac\xda\x17\x8d\x79\x51\x20\xa3\xc4\xeb\x54"
@@ -413,20 +425,100 @@ _FIRMWARE_DATA = (
     _FIRMWARE_DATA_12,
 )
 
+# whole firmware as one buffer, joined once at import. Only the blob is used
+# afterwards, so drop the chunks and let them be collected.
+_FIRMWARE_BLOB = b"".join(_FIRMWARE_DATA)
+del (
+    _FIRMWARE_DATA,
+    _FIRMWARE_DATA_1,
+    _FIRMWARE_DATA_2,
+    _FIRMWARE_DATA_3,
+    _FIRMWARE_DATA_4,
+    _FIRMWARE_DATA_5,
+    _FIRMWARE_DATA_6,
+    _FIRMWARE_DATA_7,
+    _FIRMWARE_DATA_8,
+    _FIRMWARE_DATA_9,
+    _FIRMWARE_DATA_10,
+    _FIRMWARE_DATA_11,
+    _FIRMWARE_DATA_12,
+)
+
+BurstData = namedtuple(
+    "BurstData",
+    (
+        "is_motion",
+        "is_on_surface",
+        "dx",
+        "dy",
+        "SQUAL",
+        "raw_data_sum",
+        "max_raw_data",
+        "min_raw_data",
+        "shutter_data",
+    ),
+)
+"""Values captured by :meth:`PMW3360.read_burst`"""
+
+
+class _HeldSPIDevice:
+    """Stand-in for the SPIDevice while :meth:`PMW3360.begin_fast_poll` holds
+    the bus. The bus stays locked and configured, only chip select toggles."""
+
+    __slots__ = ("spi", "chip_select")
+
+    def __init__(self, spi, chip_select) -> None:
+        self.spi = spi
+        self.chip_select = chip_select
+
+    def __enter__(self):
+        self.chip_select.value = False
+        return self.spi
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.chip_select.value = True
+        return False
+
 
 class PMW3360:
-    def __init__(self, sck, mosi, miso, cs) -> None:
-        """Initiate SPI pins, and set burst variables"""
+    # Fixed attribute set: no per-instance __dict__ on CPython (Blinka)
+    __slots__ = (
+        "spi",
+        "cs_pin",
+        "in_burst",
+        "last_burst",
+        "_tx2",
+        "_rx1",
+        "_burst_buf",
+        "device",
+        "_spi_device",
+        "_baudrate",
+    )
+
+    def __init__(self, sck, mosi, miso, cs, baudrate=8000000) -> None:
+        """Initiate SPI pins, and set burst variables
+
+        :param int baudrate: SPI clock in Hz. The datasheet maximum is 2 MHz;
+            the 8 MHz default is above that limit and is kept so existing
+            setups behave the same. Pass 2000000 to stay within spec."""
         self.spi = busio.SPI(sck, mosi, miso)
         self.cs_pin = DigitalInOut(cs)
 
         self.in_burst = False
         self.last_burst = 0
 
+        # Reused by read_reg/write_reg to avoid allocating on every access
+        self._tx2 = bytearray(2)
+        self._rx1 = bytearray(1)
+        self._burst_buf = bytearray(12)
+
         # SPI Mode 3
+        self._baudrate = baudrate
         self.device = SPIDevice(
-            self.spi, self.cs_pin, baudrate=8000000, polarity=1, phase=1
+            self.spi, self.cs_pin, baudrate=baudrate, polarity=1, phase=1
         )
+        # The real SPIDevice while begin_fast_poll holds the bus
+        self._spi_device = None
 
     def begin(self, cpi=800):
         # Shutdown first
@@ -436,19 +528,21 @@ class PMW3360:
         # Force reset
         self.write_reg(_REG_Power_Up_Reset, 0x5A)
 
-        # Read registers 0x02 to 0x06 (and discard the data)
-        self.read_reg(_REG_Motion)
-        self.read_reg(_REG_Delta_X_L)
-        self.read_reg(_REG_Delta_X_H)
-        self.read_reg(_REG_Delta_Y_L)
-        self.read_reg(_REG_Delta_Y_H)
+        # Read registers 0x02 to 0x06 (and discard the data) in one transaction
+        tx = self._tx2
+        with self.device as spi:
+            for reg_addr in range(_REG_Motion, _REG_Delta_Y_H + 1):
+                tx[0] = reg_addr
+                spi.write(tx, end=1)
+                spi.readinto(self._rx1)
 
         # Upload the firmware
         self.upload_firmware()
         self.delay_ms(10)
 
         # Set default CPI unless specified
-        self.set_CPI(cpi)
+        if not self.set_CPI(cpi):
+            return False
 
         return self.check_signature()
 
@@ -467,10 +561,13 @@ class PMW3360:
 
         with self.device as spi:
             spi.write(bytes([_REG_SROM_Load_Burst | 0x80]))
-            # send all bytes of the firmware
-            for i in range(12):
-                for y in range(len(_FIRMWARE_DATA[i])):
-                    spi.write(bytes([_FIRMWARE_DATA[i][y]]))
+            # send all bytes of the firmware. The sensor needs a short gap
+            # between SROM bytes, so they are sent one at a time through a
+            # reused buffer rather than as a single transfer.
+            out = bytearray(1)
+            for byte in _FIRMWARE_BLOB:
+                out[0] = byte
+                spi.write(out)
 
         # Read the SROM_ID register to verify the ID before any other register reads or writes.
         self.read_reg(_REG_SROM_ID)
@@ -478,25 +575,31 @@ class PMW3360:
         or 0x20 for wireless mouse design."""
         self.write_reg(_REG_Config2, 0x00)
 
-    def constrain(self, val, min_val, max_val) -> int:
-        return min(max_val, max(min_val, val))
-
     def get_CPI(self) -> int:
         """CPI = (cpival + 1)*100"""
-        cpival = bytearray(1)
         cpival = self.read_reg(_REG_Config1)
 
-        return (int(cpival[0]) + 1) * 100
+        return (cpival + 1) * 100
 
-    def set_CPI(self, cpi) -> None:
+    def set_CPI(self, cpi) -> bool:
         """Set CPI value. Default from init is 800
 
-        :param int cpi: Counts per inch."""
-        cpival = int(self.constrain((cpi / 100) - 1, 0, 119))
-
-        # Sometimes doesn't work the first time around. Keep sending until it does.
-        while self.get_CPI() != cpi:
+        :param int cpi: Counts per inch.
+        :return: False if the sensor doesn't take the new value."""
+        # 100 to 12000 CPI in steps of 100
+        cpival = cpi // 100 - 1
+        if cpival < 0:
+            cpival = 0
+        elif cpival > 119:
+            cpival = 119
+
+        # Sometimes doesn't work the first time around. Retry a few times.
+        for _ in range(_CPI_RETRIES):
             self.write_reg(_REG_Config1, cpival)
+            if self.read_reg(_REG_Config1) == cpival:
+                return True
+
+        return False
 
     def delay_ms(self, delaytime):
         time.sleep(delaytime / 1000)
@@ -505,99 +608,159 @@ class PMW3360:
         if reg_addr != _REG_Motion_Burst:
             self.in_burst = False
 
+        tx = self._tx2
+        # Send address of the register, with MSBit = 1 to indicate it's a write
+        tx[0] = reg_addr | 0x80
+        tx[1] = data
         with self.device as spi:
-            # Send address of the register, with MSBit = 1 to indicate it's a write
-            spi.write(bytes([reg_addr | 0x80]))
-            spi.write(bytes([data]))
+            spi.write(tx)
 
-    def read_reg(self, reg_addr):
+    def read_reg(self, reg_addr) -> int:
         if reg_addr != _REG_Motion_Burst:
             self.in_burst = False
 
+        tx = self._tx2
+        # Send address of the register, with MSBit = 0 to indicate it's a read
+        tx[0] = reg_addr & 0x7F
+        # Address and data stay separate transfers: the sensor needs time
+        # between receiving the address and clocking out the data (tSRAD).
         with self.device as spi:
-            # Send address of the register, with MSBit = 0 to indicate it's a read
-            spi.write(bytes([reg_addr & 0x7F]))
-            result = bytearray(1)
-            spi.readinto(result)
+            spi.write(tx, end=1)
+            spi.readinto(self._rx1)
 
-        return result
+        return self._rx1[0]
 
     def check_signature(self):
         pid = self.read_reg(_REG_Product_ID)
         iv_pid = self.read_reg(_REG_Inverse_Product_ID)
         SROM_ver = self.read_reg(_REG_SROM_ID)
 
-        return pid[0] == 66 and iv_pid[0] == 189 and SROM_ver[0] == 4
+        return pid == 66 and iv_pid == 189 and SROM_ver == 4
 
-    def read_burst(self):
-        from_last = time.monotonic() - self.last_burst
+    def _read_burst_buffer(self):
+        """Run the motion burst protocol and return the 12 raw burst bytes.
 
-        if not self.in_burst or from_last > 500:
+        The returned buffer is reused by the next burst."""
+        now = time.monotonic()
+
+        # Restart burst mode if it was left, or after 500 ms without a burst
+        if not self.in_burst or now - self.last_burst > 0.5:
             self.write_reg(_REG_Motion_Burst, 0x00)
             self.in_burst = True
 
+        burst_buffer = self._burst_buf
+        # The address byte is its own transfer: the sensor needs tSRAD_MOTBR
+        # after it before the burst data can be clocked out.
         with self.device as spi:
-            spi.write(bytes([_REG_Motion_Burst]))
-            burst_buffer = bytearray(12)
+            spi.write(_BURST_CMD)
             # Read burst buffer
             spi.readinto(burst_buffer)
 
         # Panic recovery, sometimes burst mode works weird
-        if burst_buffer[0] and 0b111:
+        if burst_buffer[0] & 0b111:
             self.in_burst = False
 
-        self.last_burst = time.monotonic()
-
-        motion = (burst_buffer[0] & 0x80) != 0
-        surface = (burst_buffer[0] & 0x08) == 0  # 0 if on surface / 1 if off surface
-
-        xl = burst_buffer[2]  # dx LSB
-        xh = burst_buffer[3]  # dx MSB
-        yl = burst_buffer[4]  # dy LSB
-        yh = burst_buffer[5]  # dy MSB
-        sl = burst_buffer[10]  # shutter LSB
-        sh = burst_buffer[11]  # shutter MSB
-
-        x = xh << 8 | xl
-        y = yh << 8 | yl
-        shutter = sh << 8 | sl
-
-        # True if a motion is detected.
-        is_motion = motion
-        # True when a chip is on a surface
-        is_on_surface = surface
-        # displacement on x directions. Unit: Count. (CPI * Count = Inch value)
-        dx = x
-        # displacement on y directions.
-        dy = y
-        # Surface Quality register, max 0x80. Number of features on the surface = SQUAL * 8
-        SQUAL = burst_buffer[6]
-        # Reports the upper byte of an 18‐bit counter
-        # which sums all 1296 raw data in the current frame
-        # * Avg value = Raw_Data_Sum * 1024 / 1296
-        raw_data_sum = burst_buffer[7]
-        # Max raw data value in current frame, max=127
-        max_raw_data = burst_buffer[8]
-        # Min raw data value in current frame, max=127
-        min_raw_data = burst_buffer[9]
-        # unit: clock cycles of the internal oscillator.
-        # shutter is adjusted to keep the average raw data values within normal operating ranges.
-        shutter_data = shutter
-
-        # Create dictionary and return it
-        data = {
-            "is_motion": is_motion,
-            "is_on_surface": is_on_surface,
-            "dx": dx,
-            "dy": dy,
-            "SQUAL": SQUAL,
-            "raw_data_sum": raw_data_sum,
-            "max_raw_data": max_raw_data,
-            "min_raw_data": min_raw_data,
-            "shutter_data": shutter_data,
-        }
-
-        return data
+        self.last_burst = now
+
+        return burst_buffer
+
+    def read_burst_motion(self):
+        """Read only the motion from a burst, as a ``(dx, dy, is_motion)`` tuple.
+
+        Lighter than :meth:`read_burst` for loops that only move a cursor."""
+        burst_buffer = self._read_burst_buffer()
+        dx, dy = struct.unpack_from("<hh", burst_buffer, 2)
+
+        return dx, dy, (burst_buffer[0] & 0x80) != 0
+
+    def read_burst_into(self, out):
+        """Read a burst into ``out`` as ``[dx, dy, motion, shutter]`` without
+        allocating, for polling at high rates.
+
+        ``motion`` is the raw Motion register: bit 7 is set on motion, bit 3 is
+        set when off the surface. Allocate ``out`` once and reuse it for every
+        call, for example ``array.array("i", [0] * 4)``. Shutter is unsigned
+        16-bit, so a ``"h"`` array is too narrow.
+
+        :param out: Mutable sequence of at least 4 ints to fill."""
+        burst_buffer = self._read_burst_buffer()
+        dx = burst_buffer[3] << 8 | burst_buffer[2]
+        dy = burst_buffer[5] << 8 | burst_buffer[4]
+
+        # Sign-extend the 16-bit deltas
+        out[0] = (dx ^ 0x8000) - 0x8000
+        out[1] = (dy ^ 0x8000) - 0x8000
+        out[2] = burst_buffer[0]
+        out[3] = burst_buffer[11] << 8 | burst_buffer[10]
+
+    def read_burst(self):
+        """Read the motion burst registers and return them as a :class:`BurstData`.
+
+        The sensor accumulates dx and dy between reads, so one burst covers
+        every frame captured since the previous call. Reading less often
+        loses no movement as long as the 16-bit counters don't overflow."""
+        (
+            motion,
+            _observation,
+            dx,
+            dy,
+            squal,
+            raw_data_sum,
+            max_raw_data,
+            min_raw_data,
+            shutter,
+        ) = struct.unpack_from(_BURST_FORMAT, self._read_burst_buffer())
+
+        return BurstData(
+            # True if a motion is detected.
+            (motion & 0x80) != 0,
+            # True when a chip is on a surface (bit is 0 on surface / 1 off surface)
+            (motion & 0x08) == 0,
+            # signed displacement on x directions. Unit: Count. (CPI * Count = Inch value)
+            dx,
+            # displacement on y directions.
+            dy,
+            # Surface Quality register, max 0x80. Number of features on the surface = SQUAL * 8
+            squal,
+            # Reports the upper byte of an 18‐bit counter
+            # which sums all 1296 raw data in the current frame
+            # * Avg value = Raw_Data_Sum * 1024 / 1296
+            raw_data_sum,
+            # Max raw data value in current frame, max=127
+            max_raw_data,
+            # Min raw data value in current frame, max=127
+            min_raw_data,
+            # Shutter, unit: clock cycles of the internal oscillator. Adjusted
+            # to keep the average raw data values within normal operating ranges.
+            shutter,
+        )
+
+    def begin_fast_poll(self):
+        """Keep the SPI bus locked and configured until :meth:`end_fast_poll`.
+
+        Saves the lock and configure steps on every register access and burst,
+        which adds up when polling at high rates. Nothing else can use the bus
+        in the meantime."""
+        if self._spi_device is not None:
+            return
+
+        while not self.spi.try_lock():
+            pass
+        # Same settings as self.device. The built-in SPIDevice doesn't expose
+        # them, so don't read them back from it.
+        self.spi.configure(baudrate=self._baudrate, polarity=1, phase=1)
+
+        self._spi_device = self.device
+        self.device = _HeldSPIDevice(self.spi, self.cs_pin)
+
+    def end_fast_poll(self):
+        """Release the SPI bus held by :meth:`begin_fast_poll`"""
+        if self._spi_device is None:
+            return
+
+        self.device = self._spi_device
+        self._spi_device = None
+        self.spi.unlock()
 
     def prepare_image(self):
         """Unused. May be too slow to be useful when used with read_image_pixel"""